@@ -75,6 +75,12 @@ impl<O: SegTreeOp> SegTree<O> {
     pub fn root(&self) -> &O::Item {
         &self.data[0]
     }
+
+    /// All items, in index order.
+    #[allow(dead_code)]
+    pub fn leaves(&self) -> &[O::Item] {
+        &self.data[self.first_leaf()..]
+    }
 }
 
 impl<O: SegTreeOp> FromIterator<O::Item> for SegTree<O>
@@ -5,7 +5,7 @@ use crate::data_structures::skipvec::SkipVec;
 use crate::small_indices::SmallIdx;
 use anyhow::{anyhow, ensure, Result};
 use log::{info, trace};
-use std::io::BufRead;
+use std::io::Read;
 use std::mem;
 use std::time::Instant;
 
@@ -33,6 +33,24 @@ impl SegTreeOp for EdgeDegreeOp {
     }
 }
 
+/// Parses the whitespace separated decimal numbers on an input line.
+fn parse_numbers(line: &[u8]) -> impl Iterator<Item = Result<usize>> + '_ {
+    line.split(u8::is_ascii_whitespace)
+        .filter(|token| !token.is_empty())
+        .map(|token| {
+            token.iter().try_fold(0_usize, |num, &byte| {
+                ensure!(
+                    byte.is_ascii_digit(),
+                    "Invalid number in input: {:?}",
+                    String::from_utf8_lossy(token)
+                );
+                num.checked_mul(10)
+                    .and_then(|num| num.checked_add(usize::from(byte - b'0')))
+                    .ok_or_else(|| anyhow!("Number too large in input"))
+            })
+        })
+}
+
 #[derive(Clone, Debug)]
 pub struct Instance {
     nodes: ContiguousIdxVec<NodeIdx>,
@@ -46,12 +64,19 @@ pub struct Instance {
 impl Instance {
     const DELETED_EDGE_DEGREE: u32 = u32::max_value();
 
-    pub fn load(mut reader: impl BufRead) -> Result<Self> {
+    pub fn load(mut reader: impl Read) -> Result<Self> {
         let time_before = Instant::now();
-        let mut line = String::new();
 
-        reader.read_line(&mut line)?;
-        let mut numbers = line.split_ascii_whitespace().map(str::parse);
+        // Read the whole input up front and parse from the in-memory buffer,
+        // avoiding a separate read call and line buffer refill per edge. The
+        // format is plain ASCII, so the bytes are parsed directly without
+        // validating them as UTF-8 first.
+        let mut input = Vec::new();
+        reader.read_to_end(&mut input)?;
+        let mut lines = input.split(|&byte| byte == b'\n');
+
+        let line = lines.next().ok_or_else(|| anyhow!("Empty input"))?;
+        let mut numbers = parse_numbers(line);
         let num_nodes = numbers
             .next()
             .ok_or_else(|| anyhow!("Missing node count"))??;
@@ -69,9 +94,10 @@ impl Instance {
         let mut edge_incidences = Vec::with_capacity(num_edges);
         let mut node_degrees = vec![0; num_nodes];
         for _ in 0..num_edges {
-            line.clear();
-            reader.read_line(&mut line)?;
-            let mut numbers = line.split_ascii_whitespace().map(str::parse::<usize>);
+            let line = lines
+                .next()
+                .ok_or_else(|| anyhow!("Missing edge line in input"))?;
+            let mut numbers = parse_numbers(line);
             let degree = numbers
                 .next()
                 .ok_or_else(|| anyhow!("empty edge line in input, expected degree"))??;
@@ -185,6 +211,12 @@ impl Instance {
         self.edge_incidences[edge_idx.idx()].len()
     }
 
+    /// Degrees of all nodes, indexed by node. Deleted nodes have degree 0.
+    #[allow(dead_code)]
+    pub fn node_degrees(&self) -> &[u32] {
+        self.node_degrees.leaves()
+    }
+
     pub fn max_node_degree(&self) -> usize {
         *self.node_degrees.root() as usize
     }
@@ -10,7 +10,6 @@ use rand::{Rng, SeedableRng};
 use serde::Serialize;
 use std::ffi::OsStr;
 use std::fs::{File, OpenOptions};
-use std::io::BufReader;
 use std::path::PathBuf;
 use structopt::StructOpt;
 
@@ -74,7 +73,7 @@ fn main() -> Result<()> {
         .and_then(OsStr::to_str)
         .ok_or_else(|| anyhow!("File name can't be extracted"))?
         .to_string();
-    let file = BufReader::new(File::open(&opts.input_file)?);
+    let file = File::open(&opts.input_file)?;
     let instance = Instance::load(file)?;
 
     let seed: u64 = OsRng.gen();
@@ -93,6 +92,8 @@ fn main() -> Result<()> {
             .has_headers(write_header)
             .from_writer(file);
         writer.serialize(CsvRecord::new(file_name, seed, &results)?)?;
+        // Dropping the writer would flush as well, but would silently ignore errors
+        writer.flush()?;
     }
 
     Ok(())
@@ -8,6 +8,8 @@ use log::{debug, info, trace, warn};
 #[cfg(feature = "activity-disable")]
 use rand::seq::SliceRandom;
 use rand::{Rng, SeedableRng};
+#[cfg(feature = "packing-bound")]
+use std::cmp::Reverse;
 use std::time::{Duration, Instant};
 
 #[derive(Debug, Clone, Default)]
@@ -75,7 +77,96 @@ fn greedy_approx(instance: &mut Instance, base_hs: Vec<NodeIdx>) -> Vec<NodeIdx>
     hs
 }
 
-fn lower_bound(instance: &Instance, partial_size: usize) -> usize {
+/// Size of a greedily computed packing, i.e. a set of pairwise disjoint edges.
+///
+/// Every edge of the packing needs its own node in any hitting set, so this
+/// is a lower bound on the size of the remaining hitting set. Edges whose
+/// nodes have small degrees are considered first, as they are less likely to
+/// block other edges from the packing.
+///
+/// The packing stops growing once it is clear whether its size reaches
+/// `limit`, so the result is only exact if it is below `limit`.
+#[cfg(feature = "packing-bound")]
+fn packing_bound(instance: &Instance, limit: usize) -> usize {
+    // Compute each edge's score once up front, since a sort key function is
+    // evaluated on every comparison. Degrees are read from the flat degree
+    // array rather than the much larger per-node incidence lists.
+    let node_degrees = instance.node_degrees();
+    let mut edges: Vec<_> = instance
+        .edges()
+        .iter()
+        .map(|&edge_idx| {
+            let score: usize = instance
+                .edge(edge_idx)
+                .map(|node_idx| node_degrees[node_idx.idx()] as usize)
+                .sum();
+            (score, edge_idx)
+        })
+        .collect();
+    edges.sort_unstable();
+
+    // Disjointness with the packing is checked against the set of nodes
+    // covered so far, instead of intersecting with every packed edge. The set
+    // is packed into 64 bit words to keep it small enough to stay in cache.
+    let mut covered = vec![0_u64; (instance.num_nodes_total() + 63) / 64];
+    let mut packing_size = 0;
+    let mut num_covered = 0;
+    let num_edges = edges.len();
+    for (idx, (_score, edge_idx)) in edges.into_iter().enumerate() {
+        // Stop once the limit is reached, the limit can no longer be reached
+        // with the remaining edges, or no uncovered node is left that another
+        // edge could use.
+        if packing_size >= limit
+            || packing_size + (num_edges - idx) < limit
+            || num_covered == instance.nodes().len()
+        {
+            break;
+        }
+
+        if instance
+            .edge(edge_idx)
+            .all(|node_idx| covered[node_idx.idx() / 64] & (1 << (node_idx.idx() % 64)) == 0)
+        {
+            for node_idx in instance.edge(edge_idx) {
+                covered[node_idx.idx() / 64] |= 1 << (node_idx.idx() % 64);
+            }
+            packing_size += 1;
+            num_covered += instance.edge_degree(edge_idx);
+        }
+    }
+    packing_size
+}
+
+/// Smallest number of nodes whose degrees sum up to at least the number of edges.
+///
+/// This is never weaker than dividing the number of edges by the maximum node
+/// degree, since it uses the actual degrees of the highest degree nodes
+/// instead of assuming that all of them have the maximum degree.
+#[cfg(feature = "packing-bound")]
+fn sum_degree_bound(instance: &Instance) -> usize {
+    let node_degrees = instance.node_degrees();
+    let mut degrees: Vec<u32> = instance
+        .nodes()
+        .iter()
+        .map(|&node_idx| node_degrees[node_idx.idx()])
+        .collect();
+    degrees.sort_unstable_by_key(|&degree| Reverse(degree));
+
+    let num_edges = instance.num_edges();
+    let mut sum = 0;
+    for (idx, &degree) in degrees.iter().enumerate() {
+        sum += degree as usize;
+        if sum >= num_edges {
+            return idx + 1;
+        }
+    }
+
+    // Only possible with empty edges, which make the instance unsolvable
+    degrees.len() + 1
+}
+
+#[cfg(not(feature = "packing-bound"))]
+fn lower_bound(instance: &Instance, partial_size: usize, _limit: usize) -> usize {
     let max_node_degree = instance.max_node_degree();
     let num_edges = instance.num_edges();
     if max_node_degree == 0 {
@@ -86,6 +177,25 @@ fn lower_bound(instance: &Instance, partial_size: usize) -> usize {
     partial_size + rem_lower_bound
 }
 
+/// Lower bound on the size of any hitting set extending the partial one.
+///
+/// Only the comparison with `limit` is relevant to callers, so bounds are
+/// not computed further than needed to decide whether the result reaches
+/// `limit`.
+#[cfg(feature = "packing-bound")]
+fn lower_bound(instance: &Instance, partial_size: usize, limit: usize) -> usize {
+    if instance.max_node_degree() == 0 {
+        // Instance already solved
+        return partial_size;
+    }
+    let rem_limit = limit.saturating_sub(partial_size);
+    let sum_degree_bound = sum_degree_bound(instance);
+    if sum_degree_bound >= rem_limit {
+        return partial_size + sum_degree_bound;
+    }
+    partial_size + sum_degree_bound.max(packing_bound(instance, rem_limit))
+}
+
 fn branch_on(node_idx: NodeIdx, instance: &mut Instance, state: &mut State<impl Rng>) {
     trace!("Branching on {}", node_idx);
 
@@ -140,15 +250,25 @@ fn solve_recursive(instance: &mut Instance, state: &mut State<impl Rng>) {
     }
 
     // Don't run reductions on the first iteration, we already do so before
-    // calculating the greedy approximation
+    // calculating the greedy approximation. The last check for stopping early
+    // always sees the fully reduced instance, so its lower bound is kept for
+    // reuse below.
+    let mut reduced_lower_bound = None;
     let reduction = if state.stats.iterations > 1 {
         reductions::reduce(
             instance,
             &mut state.partial_hs,
             &mut state.stats,
             |instance, partial_hs| match instance.min_edge_degree().map(|(deg, _idx)| deg) {
-                None | Some(0) => true,
-                _ => lower_bound(instance, partial_hs.len()) >= smallest_known_size,
+                None | Some(0) => {
+                    reduced_lower_bound = None;
+                    true
+                }
+                _ => {
+                    let bound = lower_bound(instance, partial_hs.len(), smallest_known_size);
+                    reduced_lower_bound = Some(bound);
+                    bound >= smallest_known_size
+                }
             },
         )
     } else {
@@ -160,7 +280,9 @@ fn solve_recursive(instance: &mut Instance, state: &mut State<impl Rng>) {
         state.activities.delete(removed_node_idx)
     }
 
-    if lower_bound(instance, state.partial_hs.len()) >= smallest_known_size {
+    let bound = reduced_lower_bound
+        .unwrap_or_else(|| lower_bound(instance, state.partial_hs.len(), smallest_known_size));
+    if bound >= smallest_known_size {
         // Instance unsolvable or lower bound exceeds best known size
         #[cfg(not(feature = "activity-disable"))]
         {